@@ -15,6 +15,15 @@ Description:
     Takes one or more selected clips and/or sequences and moves the positioner to a
     specific frame number.
 
+    Alternatively, moves the positioner of each selected clip and/or sequence to the
+    frame showing a shared source timecode, regardless of differing start timecodes.
+
+    Positioner frames of each selected clip and/or sequence can also be saved as a
+    named bookmark set and restored later.
+
+    On selected sequences, the positioner can be moved to the record in of a segment
+    by typing its name or a wildcard pattern.
+
 Menus:
 
     Right-click selected clips and/or sequences on the Desktop Reels --> Navigate...
@@ -23,6 +32,24 @@ Menus:
     Right-click selected clips and/or sequences in the Media Panel --> Navigate...
     --> Go to Frame Number
 
+    Right-click selected clips and/or sequences on the Desktop Reels --> Navigate...
+    --> Go to Source Timecode
+
+    Right-click selected clips and/or sequences in the Media Panel --> Navigate...
+    --> Go to Source Timecode
+
+    Right-click selected clips and/or sequences on the Desktop Reels --> Navigate...
+    --> Frame Bookmarks
+
+    Right-click selected clips and/or sequences in the Media Panel --> Navigate...
+    --> Frame Bookmarks
+
+    Right-click selected sequences on the Desktop Reels --> Navigate...
+    --> Go to Segment Name
+
+    Right-click selected sequences in the Media Panel --> Navigate...
+    --> Go to Segment Name
+
 To Install:
 
     For all users, copy this file to:
@@ -35,6 +62,11 @@ To Install:
     /Users/<user_name>/Library/Preferences/Autodesk/flame/python/
 """
 
+import fnmatch
+import json
+import os
+import re
+
 import flame
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -45,6 +77,9 @@ TITLE_VERSION = f'{TITLE} v{VERSION}'
 
 MESSAGE_PREFIX = '[PYTHON]'
 
+BOOKMARKS_PATH = os.path.join(
+        os.path.expanduser('~'), '.go_to_frame_number_bookmarks.json')
+
 
 class FlameButton(QtWidgets.QPushButton):
     """Custom Qt Flame Button Widget v2.1
@@ -102,7 +137,7 @@ class FlameButton(QtWidgets.QPushButton):
                     border: 1px solid rgb(90, 90, 90)}
                 QPushButton:pressed {
                     color: rgb(159, 159, 159);
-                    border: 1px solid rgb(90, 90, 90)
+                    border: 1px solid rgb(90, 90, 90)}
                 QPushButton:disabled {
                     color: rgb(116, 116, 116);
                     background-color: rgb(58, 58, 58);
@@ -163,6 +198,51 @@ class FlameLabel(QtWidgets.QLabel):
                     color: rgb(106, 106, 106)}""")
 
 
+class FlameLineEdit(QtWidgets.QLineEdit):
+    """Custom Qt Flame Line Edit Widget v2.1
+
+    Main window should include this: window.setFocusPolicy(QtCore.Qt.StrongFocus)
+
+    text: text show [str]
+    width: (optional) width of widget. default is 150. [int]
+    max_width: (optional) maximum width of widget. default is 2000. [int]
+
+    Usage:
+
+        line_edit = FlameLineEdit('Some text here')
+    """
+
+    def __init__(self, text, width=150, max_width=2000):
+        super().__init__()
+
+        self.setText(text)
+        self.setMinimumHeight(28)
+        self.setMinimumWidth(width)
+        self.setMaximumWidth(max_width)
+        self.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.setStyleSheet("""
+            QLineEdit {
+                color: rgb(154, 154, 154);
+                background-color: rgb(55, 65, 75);
+                selection-color: rgb(38, 38, 38);
+                selection-background-color: rgb(184, 177, 167);
+                border: 1px solid rgb(55, 65, 75);
+                padding-left: 5px;
+                font: 14px "Discreet"}
+            QLineEdit:focus {
+                background-color: rgb(73, 86, 99)}
+            QLineEdit:hover {
+                border: 1px solid rgb(90, 90, 90)}
+            QLineEdit:disabled {
+                color: rgb(106, 106, 106);
+                background-color: rgb(55, 55, 55);
+                border: 1px solid rgb(55, 55, 55)}
+            QToolTip {
+                color: rgb(170, 170, 170);
+                background-color: rgb(71, 71, 71);
+                border: 10px solid rgb(71, 71, 71)}""")
+
+
 class FlameSlider(QtWidgets.QLineEdit):
     """Custom Qt Flame Slider Widget v2.1
 
@@ -177,6 +257,63 @@ class FlameSlider(QtWidgets.QLineEdit):
         slider = FlameSlider(0, -20, 20, False)
     """
 
+    class Slider(QtWidgets.QSlider):
+
+        def __init__(self, start_value, min_value, max_value, slider_width):
+            super().__init__()
+
+            self.setMaximumHeight(4)
+            self.setMinimumWidth(slider_width)
+            self.setMaximumWidth(slider_width)
+            self.setMinimum(min_value)
+            self.setMaximum(max_value)
+            self.setValue(start_value)
+            self.setOrientation(QtCore.Qt.Horizontal)
+            self.setStyleSheet("""
+                QSlider {
+                    color: rgb(55, 65, 75);
+                    background-color: rgb(39, 45, 53)}
+                QSlider::groove {
+                    color: rgb(39, 45, 53);
+                    background-color: rgb(39, 45, 53)}
+                QSlider::handle:horizontal {
+                    background-color: rgb(102, 102, 102);
+                    width: 3px}
+                QSlider::disabled {
+                    color: rgb(106, 106, 106);
+                    background-color: rgb(55, 65, 75)}""")
+            self.setDisabled(True)
+            self.raise_()
+
+    class CalcButton(QtWidgets.QPushButton):
+        """Custom Qt Flame Button Widget for the calculator"""
+
+        def __init__(self, button_name, size_x, size_y, connect, parent, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+            self.setText(button_name)
+            self.setParent(parent)
+            self.setMinimumSize(size_x, size_y)
+            self.setMaximumSize(size_x, size_y)
+            self.setFocusPolicy(QtCore.Qt.NoFocus)
+            self.clicked.connect(connect)
+            self.setStyleSheet("""
+                QPushButton {
+                    color: rgb(154, 154, 154);
+                    background-color: rgb(58, 58, 58);
+                    border: none;
+                    font: 14px "Discreet"}
+                QPushButton:hover {
+                    border: 1px solid rgb(90, 90, 90)}
+                QPushButton:pressed {
+                    color: rgb(159, 159, 159);
+                    background-color: rgb(66, 66, 66);
+                    border: none}
+                QPushButton:disabled {
+                    color: rgb(116, 116, 116);
+                    background-color: rgb(58, 58, 58);
+                    border: none}""")
+
     def __init__(self, start_value, min_value, max_value, value_is_float=False, slider_width=110):
 
         super().__init__()
@@ -218,44 +355,16 @@ class FlameSlider(QtWidgets.QLineEdit):
                 border: 10px solid rgb(71, 71, 71)}""")
         self.clearFocus()
 
-        class Slider(QtWidgets.QSlider):
-
-            def __init__(self, start_value, min_value, max_value, slider_width):
-                super().__init__()
-
-                self.setMaximumHeight(4)
-                self.setMinimumWidth(slider_width)
-                self.setMaximumWidth(slider_width)
-                self.setMinimum(min_value)
-                self.setMaximum(max_value)
-                self.setValue(start_value)
-                self.setOrientation(QtCore.Qt.Horizontal)
-                self.setStyleSheet("""
-                    QSlider {
-                        color: rgb(55, 65, 75);
-                        background-color: rgb(39, 45, 53)}
-                    QSlider::groove {
-                        color: rgb(39, 45, 53);
-                        background-color: rgb(39, 45, 53)}
-                    QSlider::handle:horizontal {
-                        background-color: rgb(102, 102, 102);
-                        width: 3px}'
-                    QSlider::disabled {
-                        color: rgb(106, 106, 106);
-                        background-color: rgb(55, 65, 75)}""")
-                self.setDisabled(True)
-                self.raise_()
-
-        def set_slider():
-            slider666.setValue(float(self.text()))
-
-        slider666 = Slider(start_value, min_value, max_value, slider_width)
-        self.textChanged.connect(set_slider)
+        self.slider = self.Slider(start_value, min_value, max_value, slider_width)
+        self.textChanged.connect(self.set_slider)
 
         self.vbox = QtWidgets.QVBoxLayout(self)
-        self.vbox.addWidget(slider666)
+        self.vbox.addWidget(self.slider)
         self.vbox.setContentsMargins(0, 24, 0, 0)
 
+    def set_slider(self):
+        self.slider.setValue(float(self.text()))
+
     def calculator(self):
         from functools import partial
 
@@ -390,7 +499,7 @@ class FlameSlider(QtWidgets.QLineEdit):
                     border: none;
                     padding-left: 5px;
                     font: 14pt "Discreet"}
-                QLineEdit:hover {8
+                QLineEdit:hover {
                     border: 1px solid rgb(90, 90, 90)}""")
         calc_version = '1.2'
         self.clean_line = False
@@ -443,77 +552,48 @@ class FlameSlider(QtWidgets.QLineEdit):
             # For blank button - this does nothing
             pass
 
-        class FlameButton(QtWidgets.QPushButton):
-            """Custom Qt Flame Button Widget"""
-
-            def __init__(self, button_name, size_x, size_y, connect, parent, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-
-                self.setText(button_name)
-                self.setParent(parent)
-                self.setMinimumSize(size_x, size_y)
-                self.setMaximumSize(size_x, size_y)
-                self.setFocusPolicy(QtCore.Qt.NoFocus)
-                self.clicked.connect(connect)
-                self.setStyleSheet("""
-                    QPushButton {
-                        color: rgb(154, 154, 154);
-                        background-color: rgb(58, 58, 58);
-                        border: none;
-                        font: 14px "Discreet"}
-                    QPushButton:hover {
-                        border: 1px solid rgb(90, 90, 90)}
-                    QPushButton:pressed {
-                        color: rgb(159, 159, 159);
-                        background-color: rgb(66, 66, 66);
-                        border: none}
-                    QPushButton:disabled {
-                        color: rgb(116, 116, 116);
-                        background-color: rgb(58, 58, 58);
-                        border: none}""")
-
-        blank_btn = FlameButton('', 40, 28, calc_null, calc_window)
+        blank_btn = self.CalcButton('', 40, 28, calc_null, calc_window)
         blank_btn.setDisabled(True)
-        plus_minus_btn = FlameButton('+/-', 40, 28, plus_minus, calc_window)
+        plus_minus_btn = self.CalcButton('+/-', 40, 28, plus_minus, calc_window)
         plus_minus_btn.setStyleSheet('''
             color: rgb(154, 154, 154);
             background-color: rgb(45, 55, 68);
             font: 14px "Discreet"''')
-        add_btn = FlameButton('Add', 40, 28, (partial(add_sub, 'add')), calc_window)
-        sub_btn = FlameButton('Sub', 40, 28, (partial(add_sub, 'sub')), calc_window)
+        add_btn = self.CalcButton('Add', 40, 28, (partial(add_sub, 'add')), calc_window)
+        sub_btn = self.CalcButton('Sub', 40, 28, (partial(add_sub, 'sub')), calc_window)
 
         #  --------------------------------------- #
 
-        clear_btn = FlameButton('C', 40, 28, clear, calc_window)
-        equal_btn = FlameButton('=', 40, 28, equals, calc_window)
-        div_btn = FlameButton('/', 40, 28, (partial(button_press, '/')), calc_window)
-        mult_btn = FlameButton('/', 40, 28, (partial(button_press, '*')), calc_window)
+        clear_btn = self.CalcButton('C', 40, 28, clear, calc_window)
+        equal_btn = self.CalcButton('=', 40, 28, equals, calc_window)
+        div_btn = self.CalcButton('/', 40, 28, (partial(button_press, '/')), calc_window)
+        mult_btn = self.CalcButton('/', 40, 28, (partial(button_press, '*')), calc_window)
 
         #  --------------------------------------- #
 
-        _7_btn = FlameButton('7', 40, 28, (partial(button_press, '7')), calc_window)
-        _8_btn = FlameButton('8', 40, 28, (partial(button_press, '8')), calc_window)
-        _9_btn = FlameButton('9', 40, 28, (partial(button_press, '9')), calc_window)
-        minus_btn = FlameButton('-', 40, 28, (partial(button_press, '-')), calc_window)
+        _7_btn = self.CalcButton('7', 40, 28, (partial(button_press, '7')), calc_window)
+        _8_btn = self.CalcButton('8', 40, 28, (partial(button_press, '8')), calc_window)
+        _9_btn = self.CalcButton('9', 40, 28, (partial(button_press, '9')), calc_window)
+        minus_btn = self.CalcButton('-', 40, 28, (partial(button_press, '-')), calc_window)
 
         #  --------------------------------------- #
 
-        _4_btn = FlameButton('4', 40, 28, (partial(button_press, '4')), calc_window)
-        _5_btn = FlameButton('5', 40, 28, (partial(button_press, '5')), calc_window)
-        _6_btn = FlameButton('6', 40, 28, (partial(button_press, '6')), calc_window)
-        plus_btn = FlameButton('+', 40, 28, (partial(button_press, '+')), calc_window)
+        _4_btn = self.CalcButton('4', 40, 28, (partial(button_press, '4')), calc_window)
+        _5_btn = self.CalcButton('5', 40, 28, (partial(button_press, '5')), calc_window)
+        _6_btn = self.CalcButton('6', 40, 28, (partial(button_press, '6')), calc_window)
+        plus_btn = self.CalcButton('+', 40, 28, (partial(button_press, '+')), calc_window)
 
         #  --------------------------------------- #
 
-        _1_btn = FlameButton('1', 40, 28, (partial(button_press, '1')), calc_window)
-        _2_btn = FlameButton('2', 40, 28, (partial(button_press, '2')), calc_window)
-        _3_btn = FlameButton('3', 40, 28, (partial(button_press, '3')), calc_window)
-        enter_btn = FlameButton('Enter', 40, 61, enter, calc_window)
+        _1_btn = self.CalcButton('1', 40, 28, (partial(button_press, '1')), calc_window)
+        _2_btn = self.CalcButton('2', 40, 28, (partial(button_press, '2')), calc_window)
+        _3_btn = self.CalcButton('3', 40, 28, (partial(button_press, '3')), calc_window)
+        enter_btn = self.CalcButton('Enter', 40, 61, enter, calc_window)
 
         #  --------------------------------------- #
 
-        _0_btn = FlameButton('0', 89, 28, (partial(button_press, '0')), calc_window)
-        point_btn = FlameButton('.', 40, 28, (partial(button_press, '.')), calc_window)
+        _0_btn = self.CalcButton('0', 89, 28, (partial(button_press, '0')), calc_window)
+        point_btn = self.CalcButton('.', 40, 28, (partial(button_press, '.')), calc_window)
 
         gridbox = QtWidgets.QGridLayout()
         gridbox.setVerticalSpacing(5)
@@ -678,6 +758,171 @@ class FlameSlider(QtWidgets.QLineEdit):
             self.setText('%.2f' % float(value))
 
 
+def get_timebase(frame_rate):
+    """Convert a Flame frame rate string to a timecode timebase.
+
+    Args:
+        frame_rate: Frame rate string as returned by Flame, such as '23.976 fps' or
+            '29.97 fps DF'.
+
+    Returns:
+        A tuple of the integer timebase and a bool for drop frame.
+    """
+    rate = float(frame_rate.split()[0])
+    return round(rate), frame_rate.endswith(' DF')
+
+
+def timecode_to_frames(timecode, timebase, drop_frame=False):
+    """Convert a timecode string to a frame count.
+
+    Args:
+        timecode: Timecode string in the form HH:MM:SS:FF.  Any non-digit separator
+            is accepted.
+        timebase: Integer frames per second of the timecode.
+        drop_frame: Count as drop frame timecode.
+
+    Returns:
+        The number of frames since 00:00:00:00 as an integer.
+
+    Raises:
+        ValueError: If a field of the timecode is out of range for the timebase.
+    """
+    hours, minutes, seconds, frames = (
+            int(num) for num in re.findall(r'\d+', timecode))
+
+    if hours > 23 or minutes > 59 or seconds > 59 or frames >= timebase:
+        raise ValueError(f'{timecode} is not a valid timecode at {timebase} fps.')
+
+    total_minutes = hours * 60 + minutes
+    count = (total_minutes * 60 + seconds) * timebase + frames
+
+    if drop_frame:
+        count -= timebase // 15 * (total_minutes - total_minutes // 10)
+
+    return count
+
+
+def get_frames_per_day(timebase, drop_frame=False):
+    """Return the number of frames in 24 hours of timecode."""
+    return timecode_to_frames('23:59:59:00', timebase, drop_frame) + timebase
+
+
+def frames_to_timecode(count, timebase, drop_frame=False):
+    """Convert a frame count to a timecode string.
+
+    Args:
+        count: Number of frames since 00:00:00:00 as an integer.
+        timebase: Integer frames per second of the timecode.
+        drop_frame: Count as drop frame timecode.
+
+    Returns:
+        Timecode string in the form HH:MM:SS:FF, or HH:MM:SS;FF for drop frame.
+    """
+    if drop_frame:
+        drop = timebase // 15
+        ten_minutes, remainder = divmod(count, timebase * 600 - drop * 9)
+        count += drop * 9 * ten_minutes
+        if remainder > drop:
+            count += drop * ((remainder - drop) // (timebase * 60 - drop))
+
+    seconds, frames = divmod(count, timebase)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    separator = ';' if drop_frame else ':'
+
+    return f'{hours % 24:02}:{minutes:02}:{seconds:02}{separator}{frames:02}'
+
+
+def get_source_timecode_frames(timecode, frame_rates, start_timecodes, durations):
+    """Calculate the frame showing a source timecode for many clips at once.
+
+    Only plain values are used so no Flame objects are touched.  Frame rates and
+    start timecodes repeat heavily across large selections, so each distinct value
+    is converted once and reused.
+
+    Args:
+        timecode: The destination source timecode string.
+        frame_rates: Flame frame rate string of each clip.
+        start_timecodes: Start timecode string of each clip.
+        durations: Duration in frames of each clip.
+
+    Returns:
+        A list of the 1-based destination frame for each clip, or None where the
+        clip does not contain the timecode.  Clips at a frame rate the timecode is
+        not valid at, such as frame 27 at 24 fps, are also None.
+
+    Raises:
+        ValueError: If the timecode is not valid at any of the frame rates.
+    """
+    timebases = {rate: get_timebase(rate) for rate in set(frame_rates)}
+    targets = {}
+    errors = []
+    for rate, timebase in timebases.items():
+        try:
+            targets[rate] = timecode_to_frames(timecode, *timebase)
+        except ValueError as error:
+            targets[rate] = None
+            errors.append(error)
+
+    if errors and len(errors) == len(targets):
+        raise errors[0]
+
+    days = {rate: get_frames_per_day(*timebase) for rate, timebase in timebases.items()}
+    starts = {(start, rate): timecode_to_frames(start, *timebases[rate])
+              for start, rate in set(zip(start_timecodes, frame_rates))}
+
+    frames = [None if targets[rate] is None else targets[rate] - starts[start, rate] + 1
+              for start, rate in zip(start_timecodes, frame_rates)]
+
+    # Timecode earlier than the start is looked for after the clip crosses midnight
+    frames = [frame if frame is None or frame >= 1 else frame + days[rate]
+              for frame, rate in zip(frames, frame_rates)]
+
+    return [frame if frame is not None and frame <= duration else None
+            for frame, duration in zip(frames, durations)]
+
+
+def get_container_id(clip):
+    """Return the Wiretap node ID of the reel, library or folder holding a clip.
+
+    Returns None if the clip has no parent or the parent has no node ID.
+    """
+    parent = clip.parent
+    if parent is None:
+        return None
+
+    try:
+        return parent.get_wiretap_node_id()
+    except (AttributeError, RuntimeError):
+        return None
+
+
+def move_positioners(targets, message):
+    """Move the positioner of many clips, grouped by the reel or library holding them.
+
+    Writes are ordered so every clip in one container is moved before the next
+    container, rather than jumping between containers in selection order.  Clips
+    whose container cannot be identified are grouped together.  A single clip is
+    moved without looking up its container.
+
+    Args:
+        targets: List of tuples of a PyClip or PySequence, its name and the
+            destination frame.
+        message: Function to print each move to the shell.
+    """
+    if len(targets) < 2:
+        groups = {None: targets}
+    else:
+        groups = {}
+        for target in targets:
+            groups.setdefault(get_container_id(target[0]), []).append(target)
+
+    for group in groups.values():
+        for clip, name, frame in group:
+            clip.current_time = frame
+            message(f'{name} positioner moved to frame {frame}')
+
+
 class GoToFrameNumber:
     """For moving the positioner to a frame number on a selection of timelines.
 
@@ -711,10 +956,9 @@ class GoToFrameNumber:
 
     def go_to_frame(self):
         """Loop through the selections and move position to frame on each."""
-        for clip in self.selection:
-            clip.current_time = self.frame
-            self.message(f'{clip.name.get_value()} positioner moved to '
-                         f'frame {self.frame}')
+        move_positioners(
+                [(clip, clip.name.get_value(), self.frame) for clip in self.selection],
+                self.message)
 
     def main_window(self):
         """The only popup window."""
@@ -734,7 +978,13 @@ class GoToFrameNumber:
             self.window.close()
             self.message('Cancelled!')
 
+        def release_selection():
+            """Drop the Flame objects once the window is deleted."""
+            self.selection = None
+
         self.window = QtWidgets.QWidget()
+        self.window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.window.destroyed.connect(release_selection)
         self.window.setMinimumSize(self.window_size['x'], self.window_size['y'])
         self.window.setStyleSheet('background-color: #272727')
         self.window.setWindowTitle(TITLE_VERSION)
@@ -783,7 +1033,596 @@ class GoToFrameNumber:
         self.window.setLayout(self.vbox)
 
         # Center Window
-        resolution = QtGui.QGuiApplication.primaryScreen().screenGeometry()
+        resolution = QtGui.QGuiApplication.primaryScreen().geometry()
+
+        self.window.move(resolution.center().x() - self.window_size['x'] / 2,
+                         resolution.center().y() - self.window_size['y'] / 2)
+
+        self.window.show()
+
+        return self.window
+
+
+class GoToSourceTimecode:
+    """For moving the positioner to a shared source timecode on a selection of timelines.
+
+    Each clip is moved to whichever frame displays the timecode, regardless of its
+    own start timecode or frame rate.  Clips that do not contain the timecode are
+    skipped and reported.
+
+    Attributes:
+        timecode: The destination source timecode stored as a string.
+        selection: Passed along by the Flame app.
+        window_size: A dictorionary of the starting X & Y dimension of the window.
+    """
+
+    def __init__(self, selection):
+        """Start it up!
+
+        Args:
+            selection: A list of the selected Flame PyClip or PySequence objects.
+        """
+        self.selection = selection
+
+        self.message(TITLE_VERSION)
+        self.message(f'Script called from {__file__}')
+
+        self.timecode = self.get_reference_timecode(self.selection[0])
+
+        self.window_size = {'x': 360, 'y': 130}
+
+        self.main_window()
+
+    @staticmethod
+    def message(string):
+        """Print message to shell window and append global MESSAGE_PREFIX."""
+        print(' '.join([MESSAGE_PREFIX, string]))
+
+    @staticmethod
+    def get_reference_timecode(clip):
+        """Return the source timecode at the current position of the clip."""
+        timebase, drop_frame = get_timebase(clip.frame_rate)
+        start = timecode_to_frames(clip.start_time.timecode, timebase, drop_frame)
+
+        return frames_to_timecode(
+                start + clip.current_time.relative_frame - 1, timebase, drop_frame)
+
+    def go_to_timecode(self):
+        """Move the positioner on each selection to the frame showing the timecode."""
+        # Gather metadata from Flame once, then hand off plain values for the math
+        names = [clip.name.get_value() for clip in self.selection]
+        frames = get_source_timecode_frames(
+                self.timecode,
+                [clip.frame_rate for clip in self.selection],
+                [clip.start_time.timecode for clip in self.selection],
+                [clip.duration.frame for clip in self.selection])
+
+        move_positioners(
+                [target for target in zip(self.selection, names, frames)
+                 if target[2] is not None],
+                self.message)
+
+        missing = [name for name, frame in zip(names, frames) if frame is None]
+        for name in missing:
+            self.message(f'{name} does not contain timecode {self.timecode}. Skipped.')
+
+    def main_window(self):
+        """The only popup window."""
+
+        def get_timecode():
+            """Store timecode."""
+            self.timecode = self.timecode_line_edit.text()
+
+        def okay_button():
+            """Execute when ok is pressed."""
+            if not self.timecode_line_edit.hasAcceptableInput():
+                self.message(f'{self.timecode} is not a valid timecode.')
+                return
+            try:
+                self.go_to_timecode()
+            except ValueError as error:
+                self.message(str(error))
+                return
+            self.window.close()
+            self.message('Done!')
+
+        def cancel_button():
+            """Execute when cancel is pressed."""
+            self.window.close()
+            self.message('Cancelled!')
+
+        def release_selection():
+            """Drop the Flame objects once the window is deleted."""
+            self.selection = None
+
+        self.window = QtWidgets.QWidget()
+        self.window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.window.destroyed.connect(release_selection)
+        self.window.setMinimumSize(self.window_size['x'], self.window_size['y'])
+        self.window.setStyleSheet('background-color: #272727')
+        self.window.setWindowTitle(TITLE_VERSION)
+
+        # FlameLineEdit class needs this
+        self.window.setFocusPolicy(QtCore.Qt.StrongFocus)
+
+        # Labels
+        self.timecode_label = FlameLabel('Timecode')
+
+        # Line Edit
+        self.timecode_line_edit = FlameLineEdit(self.timecode)
+        self.timecode_line_edit.setValidator(QtGui.QRegularExpressionValidator(
+                QtCore.QRegularExpression(r'\d{2}[:;.][0-5]\d[:;.][0-5]\d[:;.]\d{2}')))
+        self.timecode_line_edit.textChanged.connect(get_timecode)
+
+        # Buttons
+        self.ok_btn = FlameButton('Ok', okay_button, button_color='blue')
+        self.cancel_btn = FlameButton('Cancel', cancel_button)
+
+        # Shortcuts
+        self.shortcut_enter = QtGui.QShortcut(
+                QtGui.QKeySequence('Enter'), self.ok_btn, okay_button)
+        self.shortcut_escape = QtGui.QShortcut(
+                QtGui.QKeySequence('Escape'), self.cancel_btn, cancel_button)
+        self.shortcut_return = QtGui.QShortcut(
+                QtGui.QKeySequence('Return'), self.ok_btn, okay_button)
+
+        # Layout
+        self.grid = QtWidgets.QGridLayout()
+        self.grid.setVerticalSpacing(10)
+        self.grid.setHorizontalSpacing(10)
+
+        self.grid.addWidget(self.timecode_label, 0, 0)
+        self.grid.addWidget(self.timecode_line_edit, 0, 1)
+
+        self.hbox03 = QtWidgets.QHBoxLayout()
+        self.hbox03.addStretch(1)
+        self.hbox03.addWidget(self.cancel_btn)
+        self.hbox03.addWidget(self.ok_btn)
+
+        self.vbox = QtWidgets.QVBoxLayout()
+        self.vbox.setContentsMargins(20, 20, 20, 20)
+        self.vbox.addLayout(self.grid)
+        self.vbox.addSpacing(20)
+        self.vbox.addLayout(self.hbox03)
+
+        self.window.setLayout(self.vbox)
+
+        # Center Window
+        resolution = QtGui.QGuiApplication.primaryScreen().geometry()
+
+        self.window.move(resolution.center().x() - self.window_size['x'] / 2,
+                         resolution.center().y() - self.window_size['y'] / 2)
+
+        self.window.show()
+
+        return self.window
+
+
+class FrameBookmarks:
+    """For saving and restoring the positioner of each clip as a named bookmark set.
+
+    Bookmark sets are stored in a JSON file in the user's home directory, keyed by
+    bookmark name and then by the Wiretap node ID of each clip.
+
+    Attributes:
+        bookmarks: Dictionary of bookmark names to dictionaries of clip IDs to frames.
+        name: The name of the bookmark set stored as a string.
+        selection: Passed along by the Flame app.
+        window_size: A dictorionary of the starting X & Y dimension of the window.
+    """
+
+    def __init__(self, selection):
+        """Start it up!
+
+        Args:
+            selection: A list of the selected Flame PyClip or PySequence objects.
+        """
+        self.selection = selection
+
+        self.message(TITLE_VERSION)
+        self.message(f'Script called from {__file__}')
+
+        self.bookmarks = self.load_bookmarks()
+        self.name = ''
+
+        self.window_size = {'x': 460, 'y': 130}
+
+        self.main_window()
+
+    @staticmethod
+    def message(string):
+        """Print message to shell window and append global MESSAGE_PREFIX."""
+        print(' '.join([MESSAGE_PREFIX, string]))
+
+    def load_bookmarks(self):
+        """Return all bookmark sets from disk, or an empty dict if there are none.
+
+        An unreadable file, or one that is not a dictionary of bookmark sets, is
+        reported and replaced on the next save.
+        """
+        try:
+            with open(BOOKMARKS_PATH, encoding='utf-8') as bookmarks_file:
+                bookmarks = json.load(bookmarks_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            bookmarks = None
+
+        if not (isinstance(bookmarks, dict) and
+                all(isinstance(bookmark, dict) for bookmark in bookmarks.values())):
+            self.message(f'Could not read {BOOKMARKS_PATH}. Starting with no '
+                         'bookmarks.')
+            return {}
+
+        return bookmarks
+
+    def write_bookmarks(self):
+        """Write all bookmark sets to disk, replacing the file in one step.
+
+        Returns:
+            True if the file was written, False if it could not be.
+        """
+        temp_path = f'{BOOKMARKS_PATH}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as bookmarks_file:
+                json.dump(self.bookmarks, bookmarks_file, separators=(',', ':'))
+            os.replace(temp_path, BOOKMARKS_PATH)
+        except OSError as error:
+            self.message(f'Could not write {BOOKMARKS_PATH}. {error}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        return True
+
+    def get_clip_ids(self):
+        """Return the Wiretap node ID of each selection, reporting clips without one.
+
+        Clips without a node ID are None so they are never matched to a bookmark.
+        """
+        clip_ids = [clip.get_wiretap_node_id() or None for clip in self.selection]
+
+        for clip, clip_id in zip(self.selection, clip_ids):
+            if clip_id is None:
+                self.message(f'{clip.name.get_value()} has no node ID. Skipped.')
+
+        return clip_ids
+
+    def save_bookmarks(self):
+        """Store the current positioner frame of each selection under the name.
+
+        Saving to an existing name replaces that bookmark set entirely.
+
+        Returns:
+            True if the bookmarks were written to disk, False if they could not be.
+        """
+        bookmark = {clip_id: clip.current_time.relative_frame
+                    for clip, clip_id in zip(self.selection, self.get_clip_ids())
+                    if clip_id is not None}
+        self.bookmarks[self.name] = bookmark
+
+        if not self.write_bookmarks():
+            return False
+
+        self.message(f'Saved {len(bookmark)} positions to {self.name}')
+        return True
+
+    def restore_bookmarks(self):
+        """Move the positioner on each selection back to its stored frame."""
+        bookmark = self.bookmarks.get(self.name)
+
+        if bookmark is None:
+            self.message(f'No bookmark named {self.name}')
+            return
+
+        clip_ids = self.get_clip_ids()
+
+        targets = []
+        for clip, clip_id in zip(self.selection, clip_ids):
+            if clip_id is None:
+                continue
+            name = clip.name.get_value()
+            frame = bookmark.get(clip_id)
+            if frame is None:
+                self.message(f'{name} has no position saved in {self.name}. Skipped.')
+                continue
+            targets.append((clip, name, frame))
+
+        move_positioners(targets, self.message)
+
+    def main_window(self):
+        """The only popup window."""
+
+        def get_name():
+            """Store bookmark name."""
+            self.name = self.name_line_edit.text()
+
+        def save_button():
+            """Execute when save is pressed."""
+            if not self.name:
+                self.message('Enter a bookmark name.')
+                return
+            if not self.save_bookmarks():
+                return
+            self.window.close()
+            self.message('Done!')
+
+        def restore_button():
+            """Execute when restore is pressed."""
+            if not self.name:
+                self.message('Enter a bookmark name.')
+                return
+            self.restore_bookmarks()
+            self.window.close()
+            self.message('Done!')
+
+        def cancel_button():
+            """Execute when cancel is pressed."""
+            self.window.close()
+            self.message('Cancelled!')
+
+        def release_selection():
+            """Drop the Flame objects once the window is deleted."""
+            self.selection = None
+
+        self.window = QtWidgets.QWidget()
+        self.window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.window.destroyed.connect(release_selection)
+        self.window.setMinimumSize(self.window_size['x'], self.window_size['y'])
+        self.window.setStyleSheet('background-color: #272727')
+        self.window.setWindowTitle(TITLE_VERSION)
+
+        # FlameLineEdit class needs this
+        self.window.setFocusPolicy(QtCore.Qt.StrongFocus)
+
+        # Labels
+        self.name_label = FlameLabel('Bookmark')
+
+        # Line Edit
+        self.name_line_edit = FlameLineEdit(self.name)
+        self.name_line_edit.textChanged.connect(get_name)
+        self.name_line_edit.setCompleter(
+                QtWidgets.QCompleter(sorted(self.bookmarks), self.name_line_edit))
+
+        # Buttons
+        self.restore_btn = FlameButton('Restore', restore_button, button_color='blue')
+        self.save_btn = FlameButton('Save', save_button)
+        self.cancel_btn = FlameButton('Cancel', cancel_button)
+
+        # Shortcuts
+        self.shortcut_enter = QtGui.QShortcut(
+                QtGui.QKeySequence('Enter'), self.restore_btn, restore_button)
+        self.shortcut_escape = QtGui.QShortcut(
+                QtGui.QKeySequence('Escape'), self.cancel_btn, cancel_button)
+        self.shortcut_return = QtGui.QShortcut(
+                QtGui.QKeySequence('Return'), self.restore_btn, restore_button)
+
+        # Layout
+        self.grid = QtWidgets.QGridLayout()
+        self.grid.setVerticalSpacing(10)
+        self.grid.setHorizontalSpacing(10)
+
+        self.grid.addWidget(self.name_label, 0, 0)
+        self.grid.addWidget(self.name_line_edit, 0, 1)
+
+        self.hbox03 = QtWidgets.QHBoxLayout()
+        self.hbox03.addStretch(1)
+        self.hbox03.addWidget(self.cancel_btn)
+        self.hbox03.addWidget(self.save_btn)
+        self.hbox03.addWidget(self.restore_btn)
+
+        self.vbox = QtWidgets.QVBoxLayout()
+        self.vbox.setContentsMargins(20, 20, 20, 20)
+        self.vbox.addLayout(self.grid)
+        self.vbox.addSpacing(20)
+        self.vbox.addLayout(self.hbox03)
+
+        self.window.setLayout(self.vbox)
+
+        # Center Window
+        resolution = QtGui.QGuiApplication.primaryScreen().geometry()
+
+        self.window.move(resolution.center().x() - self.window_size['x'] / 2,
+                         resolution.center().y() - self.window_size['y'] / 2)
+
+        self.window.show()
+
+        return self.window
+
+
+class GoToSegmentName:
+    """For moving the positioner to the record in of a named segment on sequences.
+
+    The segments of each sequence are indexed by name on the first lookup.  Each
+    later lookup is a dictionary hit that reads the record in of the indexed
+    segments live and checks their names still match, so trims, slips and moves
+    are followed without walking the timeline.  The index is rebuilt if a name no
+    longer matches or nothing matches the pattern, which picks up renames and new
+    shots.  A new segment given a name that is already indexed is only seen once
+    the index is rebuilt for another reason, or the window is opened again.
+
+    Attributes:
+        pattern: The segment name or wildcard pattern stored as a string.
+        segment_indexes: Dictionary of the position of each sequence in the
+            selection to its index of segment names to PySegment objects.
+        selection: Passed along by the Flame app.
+        window_size: A dictorionary of the starting X & Y dimension of the window.
+    """
+
+    def __init__(self, selection):
+        """Start it up!
+
+        Args:
+            selection: A list of the selected Flame PySequence objects.
+        """
+        self.selection = selection
+
+        self.message(TITLE_VERSION)
+        self.message(f'Script called from {__file__}')
+
+        self.pattern = ''
+        self.segment_indexes = {}
+
+        self.window_size = {'x': 460, 'y': 130}
+
+        self.main_window()
+
+    @staticmethod
+    def message(string):
+        """Print message to shell window and append global MESSAGE_PREFIX."""
+        print(' '.join([MESSAGE_PREFIX, string]))
+
+    def build_segment_index(self, position, sequence):
+        """Walk the timeline and index the named segments of a sequence."""
+        index = {}
+        for version in sequence.versions:
+            for track in version.tracks:
+                for segment in track.segments:
+                    name = segment.name.get_value()
+                    if name:
+                        index.setdefault(name, []).append(segment)
+
+        self.segment_indexes[position] = index
+
+        return index
+
+    def find_record_frame(self, index):
+        """Return the earliest record frame of the segments matching the pattern.
+
+        Returns None if nothing matches or an indexed segment has been renamed or
+        removed since the index was built.
+        """
+        if self.pattern in index:
+            names = [self.pattern]
+        else:
+            names = fnmatch.filter(index, self.pattern)
+
+        frames = []
+        for name in names:
+            for segment in index[name]:
+                try:
+                    if segment.name.get_value() != name:
+                        return None
+                    frames.append(segment.record_in.relative_frame)
+                except RuntimeError:
+                    return None
+
+        return min(frames, default=None)
+
+    def get_record_frame(self, position, sequence):
+        """Return the record frame of the pattern on a sequence, or None."""
+        index = self.segment_indexes.get(position)
+        if index is not None:
+            frame = self.find_record_frame(index)
+            if frame is not None:
+                return frame
+
+        return self.find_record_frame(self.build_segment_index(position, sequence))
+
+    def go_to_segment(self):
+        """Move the positioner on each sequence to the first matching segment."""
+        targets = []
+        for position, sequence in enumerate(self.selection):
+            name = sequence.name.get_value()
+            frame = self.get_record_frame(position, sequence)
+
+            if frame is None:
+                self.message(f'{name} has no segment matching {self.pattern}. '
+                             'Skipped.')
+                continue
+
+            targets.append((sequence, name, frame))
+
+        move_positioners(targets, self.message)
+
+    def main_window(self):
+        """The only popup window."""
+
+        def get_pattern():
+            """Store segment name pattern."""
+            self.pattern = self.pattern_line_edit.text()
+
+        def okay_button():
+            """Execute when ok is pressed."""
+            if not self.pattern:
+                self.message('Enter a segment name.')
+                return
+            self.go_to_segment()
+            self.window.close()
+            self.message('Done!')
+
+        def go_button():
+            """Execute when go is pressed, leaving the window open."""
+            if not self.pattern:
+                self.message('Enter a segment name.')
+                return
+            self.go_to_segment()
+
+        def cancel_button():
+            """Execute when cancel is pressed."""
+            self.window.close()
+            self.message('Cancelled!')
+
+        def release_selection():
+            """Drop the Flame objects and segment indexes once the window is deleted."""
+            self.selection = None
+            self.segment_indexes = {}
+
+        self.window = QtWidgets.QWidget()
+        self.window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.window.destroyed.connect(release_selection)
+        self.window.setMinimumSize(self.window_size['x'], self.window_size['y'])
+        self.window.setStyleSheet('background-color: #272727')
+        self.window.setWindowTitle(TITLE_VERSION)
+
+        # FlameLineEdit class needs this
+        self.window.setFocusPolicy(QtCore.Qt.StrongFocus)
+
+        # Labels
+        self.pattern_label = FlameLabel('Segment')
+
+        # Line Edit
+        self.pattern_line_edit = FlameLineEdit(self.pattern)
+        self.pattern_line_edit.setToolTip('Segment name.  Wildcards * and ? allowed.')
+        self.pattern_line_edit.textChanged.connect(get_pattern)
+
+        # Buttons
+        self.ok_btn = FlameButton('Ok', okay_button, button_color='blue')
+        self.go_btn = FlameButton('Go', go_button)
+        self.cancel_btn = FlameButton('Cancel', cancel_button)
+
+        # Shortcuts
+        self.shortcut_enter = QtGui.QShortcut(
+                QtGui.QKeySequence('Enter'), self.ok_btn, okay_button)
+        self.shortcut_escape = QtGui.QShortcut(
+                QtGui.QKeySequence('Escape'), self.cancel_btn, cancel_button)
+        self.shortcut_return = QtGui.QShortcut(
+                QtGui.QKeySequence('Return'), self.ok_btn, okay_button)
+
+        # Layout
+        self.grid = QtWidgets.QGridLayout()
+        self.grid.setVerticalSpacing(10)
+        self.grid.setHorizontalSpacing(10)
+
+        self.grid.addWidget(self.pattern_label, 0, 0)
+        self.grid.addWidget(self.pattern_line_edit, 0, 1)
+
+        self.hbox03 = QtWidgets.QHBoxLayout()
+        self.hbox03.addStretch(1)
+        self.hbox03.addWidget(self.cancel_btn)
+        self.hbox03.addWidget(self.go_btn)
+        self.hbox03.addWidget(self.ok_btn)
+
+        self.vbox = QtWidgets.QVBoxLayout()
+        self.vbox.setContentsMargins(20, 20, 20, 20)
+        self.vbox.addLayout(self.grid)
+        self.vbox.addSpacing(20)
+        self.vbox.addLayout(self.hbox03)
+
+        self.window.setLayout(self.vbox)
+
+        # Center Window
+        resolution = QtGui.QGuiApplication.primaryScreen().geometry()
 
         self.window.move(resolution.center().x() - self.window_size['x'] / 2,
                          resolution.center().y() - self.window_size['y'] / 2)
@@ -802,6 +1641,11 @@ def scope_clip(selection):
     return all(isinstance(item, valid_objects) for item in selection)
 
 
+def scope_sequence(selection):
+    """Filter for sequence objects."""
+    return all(isinstance(item, flame.PySequence) for item in selection)
+
+
 def get_media_panel_custom_ui_actions():
     """Python hook to add item to Media Panel or Desktop Reels right click menu."""
     return [{'name': 'Navigate...',
@@ -809,5 +1653,20 @@ def get_media_panel_custom_ui_actions():
                           'isVisible': scope_clip,
                           'execute': GoToFrameNumber,
                           'minimumVersion': '2025.0.0.0',
+                         },
+                         {'name': 'Go to Source Timecode',
+                          'isVisible': scope_clip,
+                          'execute': GoToSourceTimecode,
+                          'minimumVersion': '2025.0.0.0',
+                         },
+                         {'name': 'Frame Bookmarks',
+                          'isVisible': scope_clip,
+                          'execute': FrameBookmarks,
+                          'minimumVersion': '2025.0.0.0',
+                         },
+                         {'name': 'Go to Segment Name',
+                          'isVisible': scope_sequence,
+                          'execute': GoToSegmentName,
+                          'minimumVersion': '2025.0.0.0',
                         }]
             }]
@@ -0,0 +1,75 @@
+"""Benchmark Go to Source Timecode on large synthetic selections.
+
+Run from the repository root:
+
+    python tests/bench_timecode.py
+
+Times the metadata capture from stub clips separately from the pure math in
+get_source_timecode_frames(), and compares the math with converting every
+clip's timecodes individually.
+"""
+
+import random
+import sys
+import time
+
+import conftest  # noqa: F401  Installs the stub flame module
+import flame_stub
+import go_to_frame_number as gtfn
+
+FRAME_RATES = ['23.976 fps', '24 fps', '25 fps', '29.97 fps DF', '59.94 fps NDF']
+START_TIMECODES = ['00:59:50:00', '01:00:00:00', '10:00:00:00', '23:59:00:00']
+
+
+def make_selection(size, seed=0):
+    """Return a list of stub clips with a mix of rates and start timecodes."""
+    rng = random.Random(seed)
+    reel = flame_stub.PyReel('Reel 1')
+    return [flame_stub.PyClip(f'clip_{num}', reel,
+                              frame_rate=rng.choice(FRAME_RATES),
+                              start_timecode=rng.choice(START_TIMECODES),
+                              duration=rng.randint(100, 5000))
+            for num in range(size)]
+
+
+def per_clip_frames(timecode, frame_rates, start_timecodes, durations):
+    """Reference implementation converting every timecode for every clip."""
+    frames = []
+    for rate, start, duration in zip(frame_rates, start_timecodes, durations):
+        timebase = gtfn.get_timebase(rate)
+        frame = (gtfn.timecode_to_frames(timecode, *timebase)
+                 - gtfn.timecode_to_frames(start, *timebase) + 1)
+        if frame < 1:
+            frame += gtfn.get_frames_per_day(*timebase)
+        frames.append(frame if frame <= duration else None)
+    return frames
+
+
+def timed(function, *args):
+    """Return the result of the function and its run time in milliseconds."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(sizes=(1000, 10000, 100000)):
+    print(f'{"clips":>8} {"capture ms":>12} {"math ms":>10} {"per clip ms":>12}')
+    for size in sizes:
+        selection = make_selection(size)
+
+        def capture():
+            return ([clip.frame_rate for clip in selection],
+                    [clip.start_time.timecode for clip in selection],
+                    [clip.duration.frame for clip in selection])
+
+        columns, capture_ms = timed(capture)
+        frames, math_ms = timed(gtfn.get_source_timecode_frames, '01:00:10:00',
+                                *columns)
+        reference, reference_ms = timed(per_clip_frames, '01:00:10:00', *columns)
+        assert frames == reference
+
+        print(f'{size:>8} {capture_ms:>12.1f} {math_ms:>10.1f} {reference_ms:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (1000, 10000, 100000))
@@ -0,0 +1,200 @@
+"""Benchmark the dialog and widgets by replaying input offscreen.
+
+Run from the repository root:
+
+    python tests/bench_ui.py
+
+Each scenario replays a recorded input sequence and reports the time spent in
+the handlers for each event, the number of stylesheet re-polishes and the
+number of widgets allocated.
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+import conftest  # noqa: F401  Installs the stub flame module and offscreen Qt
+import flame_stub
+from PySide6 import QtCore, QtGui, QtTest, QtWidgets
+
+import go_to_frame_number as gtfn
+
+
+class EventCounter(QtCore.QObject):
+    """Application wide event filter counting polishes and re-polishes."""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = {'repolish': 0, 'allocated': 0}
+        self.by_class = {}
+
+    def count(self, key, widget):
+        self.counts[key] += 1
+        by_class = self.by_class.setdefault(type(widget).__name__,
+                                            {'repolish': 0, 'allocated': 0})
+        by_class[key] += 1
+
+    def eventFilter(self, watched, event):
+        if isinstance(watched, QtWidgets.QWidget):
+            if event.type() == QtCore.QEvent.StyleChange:
+                self.count('repolish', watched)
+            elif event.type() == QtCore.QEvent.Polish:
+                self.count('allocated', watched)
+        return False
+
+
+def mouse_event(kind, pos, button=QtCore.Qt.LeftButton,
+                modifiers=QtCore.Qt.NoModifier):
+    """Return a mouse event at a local position of a widget."""
+    buttons = QtCore.Qt.NoButton if kind == QtCore.QEvent.MouseButtonRelease else button
+    point = QtCore.QPointF(pos)
+    return QtGui.QMouseEvent(kind, point, point, point, button, buttons, modifiers)
+
+
+def make_selection(size=10):
+    """Return stub clips spread over two reels."""
+    reels = [flame_stub.PyReel('Reel 1'), flame_stub.PyReel('Reel 2')]
+    return [flame_stub.PyClip(f'clip_{num}', reels[num % 2]) for num in range(size)]
+
+
+def find_calculator():
+    """Return the open calculator popup."""
+    for widget in QtWidgets.QApplication.topLevelWidgets():
+        if widget.windowTitle().startswith('pyFlame Calc') and widget.isVisible():
+            return widget
+    return None
+
+
+def find_button(window, text):
+    """Return the calculator button with the given text."""
+    for button in window.findChildren(QtWidgets.QPushButton):
+        if button.text() == text:
+            return button
+    raise LookupError(text)
+
+
+def scenario_open_dialog():
+    """Open GoToFrameNumber and close it with Escape."""
+    tool = gtfn.GoToFrameNumber(make_selection())
+    yield 'open', None
+    QtTest.QTest.keyClick(tool.window, QtCore.Qt.Key_Escape)
+    yield 'escape', None
+
+
+def scenario_hover_widgets():
+    """Move the mouse over and off the label and the Ok and Cancel buttons."""
+    tool = gtfn.GoToFrameNumber(make_selection())
+    yield 'open', None
+    for widget in (tool.frame_label, tool.cancel_btn, tool.ok_btn) * 10:
+        QtWidgets.QApplication.sendEvent(
+                widget, QtGui.QEnterEvent(QtCore.QPointF(5, 5), QtCore.QPointF(5, 5),
+                                          QtCore.QPointF(5, 5)))
+        widget.update()
+        yield 'hover', None
+        QtWidgets.QApplication.sendEvent(widget, QtCore.QEvent(QtCore.QEvent.Leave))
+        widget.update()
+        yield 'leave', None
+    QtTest.QTest.keyClick(tool.window, QtCore.Qt.Key_Escape)
+    yield 'escape', None
+
+
+def scenario_drag_slider():
+    """Drag the frame slider right by 200 pixels in single pixel steps."""
+    tool = gtfn.GoToFrameNumber(make_selection())
+    slider = tool.frame_slider
+    yield 'open', None
+    QtWidgets.QApplication.sendEvent(
+            slider, mouse_event(QtCore.QEvent.MouseButtonPress, QtCore.QPoint(10, 10)))
+    yield 'press', None
+    for x in range(11, 211):
+        QtWidgets.QApplication.sendEvent(
+                slider, mouse_event(QtCore.QEvent.MouseMove, QtCore.QPoint(x, 10)))
+        yield 'move', None
+    QtWidgets.QApplication.sendEvent(
+            slider, mouse_event(QtCore.QEvent.MouseButtonRelease, QtCore.QPoint(210, 10)))
+    yield 'release', None
+    assert tool.frame == 201, tool.frame
+    QtTest.QTest.keyClick(tool.window, QtCore.Qt.Key_Return)
+    yield 'enter', None
+
+
+def scenario_calculator():
+    """Click the slider to open the calculator, type 1234 and press Enter."""
+    tool = gtfn.GoToFrameNumber(make_selection())
+    slider = tool.frame_slider
+    yield 'open', None
+    QtWidgets.QApplication.sendEvent(
+            slider, mouse_event(QtCore.QEvent.MouseButtonPress, QtCore.QPoint(10, 10)))
+    yield 'press', None
+    QtWidgets.QApplication.sendEvent(
+            slider, mouse_event(QtCore.QEvent.MouseButtonRelease, QtCore.QPoint(10, 10)))
+    yield 'open calculator', None
+    calculator = find_calculator()
+    for key in '1234':
+        find_button(calculator, key).click()
+        yield 'calculator key', None
+    find_button(calculator, 'Enter').click()
+    yield 'calculator enter', None
+    assert tool.frame == 1234, tool.frame
+    QtTest.QTest.keyClick(tool.window, QtCore.Qt.Key_Escape)
+    yield 'escape', None
+
+
+SCENARIOS = {
+    'open dialog': scenario_open_dialog,
+    'hover': scenario_hover_widgets,
+    'drag slider': scenario_drag_slider,
+    'calculator': scenario_calculator,
+}
+
+
+def run_scenario(scenario, counter):
+    """Replay a scenario and return per step stats keyed by step name."""
+    stats = {}
+    steps = scenario()
+    while True:
+        before = dict(counter.counts)
+        start = time.perf_counter()
+        try:
+            name, _ = next(steps)
+        except StopIteration:
+            break
+        QtWidgets.QApplication.processEvents()
+        elapsed = time.perf_counter() - start
+        step = stats.setdefault(name, {'events': 0, 'ms': 0.0, 'repolish': 0,
+                                       'allocated': 0})
+        step['events'] += 1
+        step['ms'] += elapsed * 1000
+        for key in ('repolish', 'allocated'):
+            step[key] += counter.counts[key] - before[key]
+    return stats
+
+
+def main(repeats=5):
+    QtCore.qInstallMessageHandler(lambda *args: None)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    counter = EventCounter()
+    app.installEventFilter(counter)
+
+    print(f'{"scenario":<12} {"step":<17} {"events":>6} {"ms/event":>9} '
+          f'{"repolish":>9} {"allocated":>10}')
+    for scenario_name, scenario in SCENARIOS.items():
+        totals = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeats):
+                for name, step in run_scenario(scenario, counter).items():
+                    total = totals.setdefault(name, dict.fromkeys(step, 0))
+                    for key, value in step.items():
+                        total[key] += value
+        for name, total in totals.items():
+            print(f'{scenario_name:<12} {name:<17} {total["events"] // repeats:>6} '
+                  f'{total["ms"] / total["events"]:>9.3f} '
+                  f'{total["repolish"] // repeats:>9} '
+                  f'{total["allocated"] // repeats:>10}')
+
+    app.removeEventFilter(counter)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark grouped positioner writes against the original per-clip loop.
+
+Run from the repository root:
+
+    python tests/bench_writes.py
+
+The stub models Flame redrawing the reel or library view whenever a write
+lands in a different container than the previous write.  Each refresh, each
+write and each parent lookup is charged a fixed cost by busy waiting, so the
+wall time includes the extra container lookups made by grouping.
+"""
+
+import sys
+import time
+
+import conftest  # noqa: F401  Installs the stub flame module
+import flame_stub
+import go_to_frame_number as gtfn
+
+WRITE_COST = 0.00002
+REFRESH_COST = 0.0002
+LOOKUP_COST = 0.000005
+
+
+def charge(seconds):
+    """Busy wait to simulate time spent inside Flame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class RefreshModel:
+    """Counts refreshes, charging one when the written container changes."""
+
+    def __init__(self, charged=True):
+        self.charged = charged
+        self.refreshes = 0
+        self.last_container = None
+
+    def __call__(self, clip):
+        if self.charged:
+            charge(WRITE_COST)
+        if clip.parent is not self.last_container:
+            self.refreshes += 1
+            self.last_container = clip.parent
+            if self.charged:
+                charge(REFRESH_COST)
+
+
+class ChargedReel(flame_stub.PyReel):
+    """Reel charging a cost for each node ID lookup."""
+
+    charged = True
+
+    def get_wiretap_node_id(self):
+        if self.charged:
+            charge(LOOKUP_COST)
+        return super().get_wiretap_node_id()
+
+
+def make_selection(size, containers):
+    """Return clips whose containers alternate in selection order."""
+    reels = [ChargedReel(f'Reel {num}') for num in range(containers)]
+    return [flame_stub.PyClip(f'clip_{num}', reels[num % containers])
+            for num in range(size)]
+
+
+def per_clip_loop(targets, message):
+    """The original go_to_frame loop, writing in selection order."""
+    for clip, name, frame in targets:
+        clip.current_time = frame
+        message(f'{name} positioner moved to frame {frame}')
+
+
+def run(function, selection, charged=True):
+    """Return the refresh count and wall time in ms of writing the selection."""
+    model = RefreshModel(charged)
+    flame_stub.PyClip.refresh = staticmethod(model)
+    ChargedReel.charged = charged
+    targets = [(clip, clip.name.get_value(), 10) for clip in selection]
+    start = time.perf_counter()
+    function(targets, lambda string: None)
+    elapsed = (time.perf_counter() - start) * 1000
+    flame_stub.PyClip.refresh = staticmethod(lambda clip: None)
+    return model.refreshes, elapsed
+
+
+def main(size=2000):
+    print(f'{"containers":>10} {"loop refreshes":>15} {"loop ms":>8} '
+          f'{"grouped refreshes":>18} {"grouped ms":>11}')
+    for containers in (1, 2, 10, 50):
+        selection = make_selection(size, containers)
+        loop_refreshes, loop_ms = run(per_clip_loop, selection)
+        grouped_refreshes, grouped_ms = run(gtfn.move_positioners, selection)
+        print(f'{containers:>10} {loop_refreshes:>15} {loop_ms:>8.1f} '
+              f'{grouped_refreshes:>18} {grouped_ms:>11.1f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,24 @@
+"""Load go_to_frame_number.py with a stub flame module and an offscreen Qt."""
+
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, TESTS_DIR)
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import flame_stub  # noqa: E402
+
+sys.modules.setdefault('flame', flame_stub.make_module())
+
+import pytest  # noqa: E402
+from PySide6 import QtCore, QtWidgets  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """Return the QApplication shared by all tests."""
+    QtCore.qInstallMessageHandler(lambda *args: None)
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
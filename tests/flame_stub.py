@@ -0,0 +1,117 @@
+"""Minimal stand-in for the flame module so the script can load outside Flame.
+
+Only the parts of the Flame Python API used by go_to_frame_number.py are
+provided.  Every positioner write and every refresh it would cause are counted
+so the tests and benchmarks can compare write strategies.
+"""
+
+import itertools
+import types
+
+NODE_IDS = itertools.count(1)
+
+
+class PyAttribute:
+    """Stand-in for flame.PyAttribute."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get_value(self):
+        return self.value
+
+    def set_value(self, value):
+        self.value = value
+
+
+class PyTime:
+    """Stand-in for flame.PyTime."""
+
+    def __init__(self, frame, timecode=None):
+        self.frame = frame
+        self.relative_frame = frame
+        self.timecode = timecode
+
+
+class PyArchiveEntry:
+    """Stand-in for flame.PyArchiveEntry."""
+
+    def __init__(self, name, parent=None):
+        self.name = PyAttribute(name)
+        self.parent = parent
+        self.node_id = f'/stub/{next(NODE_IDS)}'
+
+    def get_wiretap_node_id(self):
+        return self.node_id
+
+
+class PyReel(PyArchiveEntry):
+    """Stand-in for flame.PyReel."""
+
+
+class PyClip(PyArchiveEntry):
+    """Stand-in for flame.PyClip.
+
+    Setting current_time calls the refresh callable of the class, which the
+    benchmarks replace to charge a cost for each viewer refresh.
+    """
+
+    refresh = staticmethod(lambda clip: None)
+    writes = 0
+
+    def __init__(self, name, parent=None, frame_rate='24 fps',
+                 start_timecode='01:00:00:00', duration=100):
+        super().__init__(name, parent)
+        self.frame_rate = frame_rate
+        self.start_time = PyTime(1, start_timecode)
+        self.duration = PyTime(duration)
+        self._current_time = PyTime(1)
+
+    @property
+    def current_time(self):
+        return self._current_time
+
+    @current_time.setter
+    def current_time(self, frame):
+        PyClip.writes += 1
+        self._current_time = PyTime(frame)
+        self.refresh(self)
+
+
+class PySegment:
+    """Stand-in for flame.PySegment."""
+
+    def __init__(self, name, record_in):
+        self.name = PyAttribute(name)
+        self.record_in = PyTime(record_in)
+
+
+class PyTrack:
+    """Stand-in for flame.PyTrack."""
+
+    def __init__(self, segments):
+        self.segments = segments
+
+
+class PyVersion:
+    """Stand-in for flame.PyVersion."""
+
+    def __init__(self, tracks):
+        self.tracks = tracks
+
+
+class PySequence(PyClip):
+    """Stand-in for flame.PySequence."""
+
+    def __init__(self, name, parent=None, versions=(), **kwargs):
+        super().__init__(name, parent, **kwargs)
+        self.versions = list(versions)
+
+
+def make_module():
+    """Return a module object to install as sys.modules['flame']."""
+    module = types.ModuleType('flame')
+    for cls in (PyAttribute, PyTime, PyArchiveEntry, PyReel, PyClip, PySegment,
+                PyTrack, PyVersion, PySequence):
+        setattr(module, cls.__name__, cls)
+    return module
@@ -0,0 +1,104 @@
+"""Tests for saving and restoring Frame Bookmarks."""
+
+import flame_stub
+import pytest
+
+import go_to_frame_number as gtfn
+
+
+@pytest.fixture
+def bookmarks_path(tmp_path, monkeypatch):
+    path = tmp_path / 'bookmarks.json'
+    monkeypatch.setattr(gtfn, 'BOOKMARKS_PATH', str(path))
+    return path
+
+
+@pytest.fixture
+def clips():
+    reel = flame_stub.PyReel('Reel 1')
+    return [flame_stub.PyClip(f'clip_{num}', reel) for num in range(3)]
+
+
+def make_tool(qapp, selection, name):
+    tool = gtfn.FrameBookmarks(selection)
+    tool.name = name
+    return tool
+
+
+def test_save_and_restore(qapp, bookmarks_path, clips):
+    for frame, clip in enumerate(clips, start=10):
+        clip.current_time = frame
+    make_tool(qapp, clips, 'client review v3').save_bookmarks()
+
+    for clip in clips:
+        clip.current_time = 1
+    make_tool(qapp, clips, 'client review v3').restore_bookmarks()
+
+    assert [clip.current_time.relative_frame for clip in clips] == [10, 11, 12]
+
+
+def test_save_replaces_existing_set(qapp, bookmarks_path, clips):
+    make_tool(qapp, clips, 'review').save_bookmarks()
+    make_tool(qapp, clips[:1], 'review').save_bookmarks()
+
+    tool = make_tool(qapp, clips, 'review')
+    assert list(tool.bookmarks['review']) == [clips[0].get_wiretap_node_id()]
+
+
+def test_corrupt_file_starts_empty(qapp, bookmarks_path, clips, capsys):
+    bookmarks_path.write_text('{"review": {"/stub/1": 1', encoding='utf-8')
+
+    tool = make_tool(qapp, clips, 'review')
+
+    assert tool.bookmarks == {}
+    assert 'Could not read' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('contents', ['[1, 2]', '"review"', '{"review": [1]}'])
+def test_non_dict_file_starts_empty(qapp, bookmarks_path, clips, capsys, contents):
+    bookmarks_path.write_text(contents, encoding='utf-8')
+
+    tool = make_tool(qapp, clips, 'review')
+    assert tool.bookmarks == {}
+    assert 'Could not read' in capsys.readouterr().out
+
+    assert tool.save_bookmarks()
+
+
+def test_write_error_is_reported_and_temp_removed(
+        qapp, tmp_path, monkeypatch, clips, capsys):
+    path = tmp_path / 'missing_dir' / 'bookmarks.json'
+    monkeypatch.setattr(gtfn, 'BOOKMARKS_PATH', str(path))
+    tool = make_tool(qapp, clips, 'review')
+
+    assert not tool.save_bookmarks()
+    assert 'Could not write' in capsys.readouterr().out
+    assert not path.exists()
+
+
+def test_replace_error_removes_temp_file(qapp, bookmarks_path, monkeypatch, clips):
+    def fail(*args):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(gtfn.os, 'replace', fail)
+    tool = make_tool(qapp, clips, 'review')
+
+    assert not tool.save_bookmarks()
+    assert list(bookmarks_path.parent.iterdir()) == []
+
+
+def test_clips_without_node_id_are_skipped(qapp, bookmarks_path, clips, capsys):
+    for frame, clip in enumerate(clips, start=10):
+        clip.current_time = frame
+    clips[0].node_id = ''
+    clips[1].node_id = None
+    make_tool(qapp, clips, 'review').save_bookmarks()
+
+    for clip in clips:
+        clip.current_time = 1
+    tool = make_tool(qapp, clips, 'review')
+    tool.restore_bookmarks()
+
+    assert list(tool.bookmarks['review']) == [clips[2].get_wiretap_node_id()]
+    assert [clip.current_time.relative_frame for clip in clips] == [1, 1, 12]
+    assert 'clip_0 has no node ID. Skipped.' in capsys.readouterr().out
@@ -0,0 +1,89 @@
+"""Memory regression tests for repeatedly opening and closing the tools."""
+
+import contextlib
+import gc
+import os
+import tracemalloc
+import weakref
+
+import bench_ui
+import flame_stub
+from PySide6 import QtCore, QtWidgets
+
+import go_to_frame_number as gtfn
+
+# Keeping every closed GoToFrameNumber alive grows memory by about 7 KB per
+# open, so 2000 opens would leak around 14 MB.  PySide6 keeps a few small
+# internal caches that settle at well under this limit.
+MAX_GROWTH = 512 * 1024
+
+
+def flush():
+    """Run deferred deletes and collect Python garbage."""
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    QtWidgets.QApplication.processEvents()
+    gc.collect()
+
+
+def open_and_close(tool_class, selection):
+    tool = tool_class(selection)
+    tool.window.close()
+
+
+def open_calculator_and_close():
+    tool = gtfn.GoToFrameNumber(bench_ui.make_selection())
+    tool.frame_slider.calculator()
+    bench_ui.find_calculator().close()
+    tool.window.close()
+
+
+def memory_growth(function, warmup=200, repeats=2000):
+    """Return the bytes still allocated after repeating the function."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup):
+            function()
+        flush()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(repeats):
+            function()
+        flush()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return after - before
+
+
+def test_closed_window_releases_tool_and_selection(qapp):
+    selection = bench_ui.make_selection()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        tool = gtfn.GoToFrameNumber(selection)
+    widgets = len(QtWidgets.QApplication.allWidgets())
+    tool_ref = weakref.ref(tool)
+    clip_ref = weakref.ref(selection[0])
+
+    tool.window.close()
+    del tool, selection
+    flush()
+
+    assert tool_ref() is None
+    assert clip_ref() is None
+    assert len(QtWidgets.QApplication.allWidgets()) < widgets
+
+
+def test_go_to_frame_number_memory_is_flat(qapp):
+    selection = [flame_stub.PyClip(f'clip_{num}') for num in range(100)]
+    widgets = len(QtWidgets.QApplication.allWidgets())
+
+    growth = memory_growth(lambda: open_and_close(gtfn.GoToFrameNumber, selection))
+
+    assert growth < MAX_GROWTH
+    assert len(QtWidgets.QApplication.allWidgets()) == widgets
+
+
+def test_calculator_memory_is_flat(qapp):
+    widgets = len(QtWidgets.QApplication.allWidgets())
+
+    growth = memory_growth(open_calculator_and_close, warmup=100, repeats=1000)
+
+    assert growth < MAX_GROWTH
+    assert len(QtWidgets.QApplication.allWidgets()) == widgets
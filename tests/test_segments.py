@@ -0,0 +1,111 @@
+"""Tests for Go to Segment Name."""
+
+import flame_stub
+import pytest
+
+import go_to_frame_number as gtfn
+
+
+class CountingTrack(flame_stub.PyTrack):
+    """Track counting how often its segments are walked."""
+
+    walks = 0
+
+    @property
+    def segments(self):
+        CountingTrack.walks += 1
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments):
+        self._segments = segments
+
+
+@pytest.fixture
+def sequence():
+    segments = [flame_stub.PySegment(f'sh{num:04}', num * 10 + 1)
+                for num in range(2000)]
+    segments.append(flame_stub.PySegment('', 20001))
+    segments.append(flame_stub.PySegment('sh0005', 30001))
+    track = CountingTrack(segments)
+    return flame_stub.PySequence('conform', flame_stub.PyReel('Reel 1'),
+                                 versions=[flame_stub.PyVersion([track])],
+                                 duration=40000)
+
+
+def go(tool, pattern):
+    tool.pattern = pattern
+    tool.go_to_segment()
+    return tool.selection[0].current_time.relative_frame
+
+
+def test_exact_name_uses_earliest_record_in(qapp, sequence):
+    tool = gtfn.GoToSegmentName([sequence])
+
+    assert go(tool, 'sh0005') == 51
+
+
+def test_wildcard_pattern(qapp, sequence):
+    tool = gtfn.GoToSegmentName([sequence])
+
+    assert go(tool, 'sh19*') == 19001
+
+
+def test_missing_name_does_not_move(qapp, sequence):
+    tool = gtfn.GoToSegmentName([sequence])
+    sequence.current_time = 7
+
+    assert go(tool, 'nope') == 7
+
+
+def test_timeline_walked_once_per_window(qapp, sequence):
+    CountingTrack.walks = 0
+    tool = gtfn.GoToSegmentName([sequence])
+    for num in range(0, 2000, 100):
+        assert go(tool, f'sh{num:04}') == num * 10 + 1
+
+    assert CountingTrack.walks == 1
+
+
+def test_new_window_sees_renamed_segment(qapp, sequence):
+    assert go(gtfn.GoToSegmentName([sequence]), 'sh0001') == 11
+
+    segment = sequence.versions[0].tracks[0].segments[1]
+    segment.name.set_value('renamed')
+    tool = gtfn.GoToSegmentName([sequence])
+
+    assert go(tool, 'renamed') == 11
+    assert go(tool, 'sh0000') == 1
+    sequence.current_time = 3
+    assert go(tool, 'sh0001') == 3
+
+
+def test_same_window_follows_trims_and_renames(qapp, sequence):
+    segments = sequence.versions[0].tracks[0].segments
+    tool = gtfn.GoToSegmentName([sequence])
+    assert go(tool, 'sh0010') == 101
+
+    CountingTrack.walks = 0
+    segments[10].record_in = flame_stub.PyTime(105)
+    assert go(tool, 'sh0010') == 105
+    assert CountingTrack.walks == 0
+
+    segments[10].name.set_value('sh0010_v2')
+    sequence.current_time = 3
+    assert go(tool, 'sh0010') == 3
+    assert go(tool, 'sh0010_v2') == 105
+
+
+def test_sequences_without_node_ids_keep_separate_indexes(qapp):
+    sequences = []
+    for offset in (0, 500):
+        track = flame_stub.PyTrack([flame_stub.PySegment('sh0001', offset + 1)])
+        sequence = flame_stub.PySequence('seq', versions=[flame_stub.PyVersion([track])])
+        sequence.node_id = None
+        sequences.append(sequence)
+    tool = gtfn.GoToSegmentName(sequences)
+
+    tool.pattern = 'sh0001'
+    tool.go_to_segment()
+
+    assert [seq.current_time.relative_frame for seq in sequences] == [1, 501]
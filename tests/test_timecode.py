@@ -0,0 +1,111 @@
+"""Tests for the timecode helpers used by Go to Source Timecode."""
+
+import flame_stub
+import pytest
+
+import go_to_frame_number as gtfn
+
+
+@pytest.mark.parametrize('frame_rate, expected', [
+    ('23.976 fps', (24, False)),
+    ('25 fps', (25, False)),
+    ('29.97 fps DF', (30, True)),
+    ('29.97 fps NDF', (30, False)),
+    ('59.94 fps DF', (60, True)),
+])
+def test_get_timebase(frame_rate, expected):
+    assert gtfn.get_timebase(frame_rate) == expected
+
+
+@pytest.mark.parametrize('timebase, drop_frame', [
+    (24, False), (25, False), (30, False), (30, True), (60, True)])
+def test_round_trip(timebase, drop_frame):
+    day = gtfn.get_frames_per_day(timebase, drop_frame)
+    for count in range(0, day, 997):
+        timecode = gtfn.frames_to_timecode(count, timebase, drop_frame)
+        assert gtfn.timecode_to_frames(timecode, timebase, drop_frame) == count
+
+
+@pytest.mark.parametrize('count, timecode', [
+    (1799, '00:00:59;29'),
+    (1800, '00:01:00;02'),
+    (17982, '00:10:00;00'),
+    (107892, '01:00:00;00'),
+])
+def test_drop_frame_skips_labels(count, timecode):
+    assert gtfn.frames_to_timecode(count, 30, True) == timecode
+    assert gtfn.timecode_to_frames(timecode, 30, True) == count
+
+
+@pytest.mark.parametrize('timecode', ['01:00:00:24', '01:00:60:00', '01:60:00:00'])
+def test_out_of_range_fields_are_rejected(timecode):
+    with pytest.raises(ValueError):
+        gtfn.timecode_to_frames(timecode, 24)
+
+
+def test_mixed_rate_selection():
+    frames = gtfn.get_source_timecode_frames(
+            '01:00:01:00',
+            ['24 fps', '25 fps', '29.97 fps DF', '24 fps'],
+            ['01:00:00:00', '01:00:00:00', '01:00:00;00', '00:59:59:00'],
+            [100, 100, 100, 100])
+
+    assert frames == [25, 26, 31, 49]
+
+
+def test_clips_without_timecode_are_none():
+    frames = gtfn.get_source_timecode_frames(
+            '01:00:10:00', ['24 fps', '24 fps'], ['01:00:00:00', '01:00:09:00'],
+            [100, 100])
+
+    assert frames == [None, 25]
+
+
+def test_timecode_crossing_midnight():
+    start = gtfn.timecode_to_frames('23:59:59:00', 24)
+    timecode = gtfn.frames_to_timecode(start + 47, 24)
+
+    assert timecode == '00:00:00:23'
+    assert gtfn.get_source_timecode_frames(
+            timecode, ['24 fps'], ['23:59:59:00'], [100]) == [48]
+
+
+def test_hours_past_midnight_are_rejected():
+    with pytest.raises(ValueError):
+        gtfn.timecode_to_frames('25:00:00:00', 24)
+
+
+def test_frame_only_valid_at_higher_rate_skips_lower_rate_clips():
+    frames = gtfn.get_source_timecode_frames(
+            '01:00:00:27', ['24 fps', '29.97 fps NDF', '25 fps'],
+            ['01:00:00:00', '01:00:00:00', '01:00:00:00'], [100, 100, 100])
+
+    assert frames == [None, 28, None]
+
+
+def test_timecode_invalid_at_every_rate_raises():
+    with pytest.raises(ValueError):
+        gtfn.get_source_timecode_frames(
+                '01:00:00:27', ['24 fps', '25 fps'], ['01:00:00:00'] * 2, [100] * 2)
+
+
+def test_go_to_timecode_moves_and_reports_skips(qapp, capsys):
+    reel = flame_stub.PyReel('Reel 1')
+    clips = [
+        flame_stub.PyClip('a_30', reel, frame_rate='29.97 fps NDF'),
+        flame_stub.PyClip('b_24', reel, frame_rate='24 fps'),
+        flame_stub.PyClip('c_30_late', reel, frame_rate='29.97 fps NDF',
+                          start_timecode='02:00:00:00'),
+    ]
+    clips[0].current_time = 28
+    tool = gtfn.GoToSourceTimecode(clips)
+    capsys.readouterr()
+
+    assert tool.timecode == '01:00:00:27'
+    tool.go_to_timecode()
+
+    out = capsys.readouterr().out
+    assert [clip.current_time.relative_frame for clip in clips] == [28, 1, 1]
+    assert 'a_30 positioner moved to frame 28' in out
+    assert 'b_24 does not contain timecode 01:00:00:27. Skipped.' in out
+    assert 'c_30_late does not contain timecode 01:00:00:27. Skipped.' in out
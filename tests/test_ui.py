@@ -0,0 +1,51 @@
+"""Regression tests for the interaction costs reported by bench_ui.py."""
+
+import bench_ui
+import pytest
+
+
+@pytest.fixture
+def counter(qapp):
+    counter = bench_ui.EventCounter()
+    qapp.installEventFilter(counter)
+    yield counter
+    qapp.removeEventFilter(counter)
+
+
+def test_dragging_slider_does_not_repolish_or_allocate(counter):
+    stats = bench_ui.run_scenario(bench_ui.scenario_drag_slider, counter)
+
+    assert stats['move']['events'] == 200
+    assert stats['move']['repolish'] == 0
+    assert stats['move']['allocated'] == 0
+
+
+def test_calculator_keys_do_not_repolish_or_allocate(counter):
+    stats = bench_ui.run_scenario(bench_ui.scenario_calculator, counter)
+
+    assert stats['calculator key']['repolish'] == 0
+    assert stats['calculator key']['allocated'] == 0
+
+
+def test_escape_closes_dialog_without_moving(counter):
+    writes = bench_ui.flame_stub.PyClip.writes
+    bench_ui.run_scenario(bench_ui.scenario_open_dialog, counter)
+
+    assert bench_ui.flame_stub.PyClip.writes == writes
+
+
+def test_opening_dialog_allocates_and_polishes_buttons_and_label_once(counter):
+    bench_ui.run_scenario(bench_ui.scenario_open_dialog, counter)
+
+    # One re-polish each from setStyleSheet and from joining the styled window
+    assert counter.by_class['FlameButton'] == {'repolish': 4, 'allocated': 2}
+    assert counter.by_class['FlameLabel'] == {'repolish': 2, 'allocated': 1}
+
+
+def test_hovering_buttons_and_label_does_not_repolish_or_allocate(counter):
+    stats = bench_ui.run_scenario(bench_ui.scenario_hover_widgets, counter)
+
+    for step in ('hover', 'leave'):
+        assert stats[step]['events'] == 30
+        assert stats[step]['repolish'] == 0
+        assert stats[step]['allocated'] == 0
@@ -0,0 +1,63 @@
+"""Tests for grouping positioner writes by container."""
+
+import bench_writes
+import flame_stub
+
+import go_to_frame_number as gtfn
+
+
+def write_order(targets):
+    order = []
+    gtfn.move_positioners(targets, order.append)
+    return [line.split()[0] for line in order]
+
+
+def make_targets(clips):
+    return [(clip, clip.name.get_value(), 5) for clip in clips]
+
+
+def test_writes_grouped_by_container_in_first_seen_order():
+    reels = [flame_stub.PyReel('A'), flame_stub.PyReel('B')]
+    clips = [flame_stub.PyClip(f'clip_{num}', reels[num % 2]) for num in range(4)]
+
+    assert write_order(make_targets(clips)) == ['clip_0', 'clip_2', 'clip_1', 'clip_3']
+    assert all(clip.current_time.relative_frame == 5 for clip in clips)
+
+
+def test_unknown_containers_do_not_stop_the_batch():
+    reel = flame_stub.PyReel('A')
+    clips = [flame_stub.PyClip('clip_0', None),
+             flame_stub.PyClip('clip_1', reel),
+             flame_stub.PyClip('clip_2', object())]
+
+    assert write_order(make_targets(clips)) == ['clip_0', 'clip_2', 'clip_1']
+
+
+class NoLookupClip(flame_stub.PyClip):
+    """Clip failing the test if its container is looked up."""
+
+    @property
+    def parent(self):
+        raise AssertionError('container looked up')
+
+    @parent.setter
+    def parent(self, parent):
+        pass
+
+
+def test_single_clip_skips_container_lookup():
+    clip = NoLookupClip('clip_0')
+
+    assert write_order(make_targets([clip])) == ['clip_0']
+
+
+def test_grouping_reduces_modelled_refreshes():
+    selection = bench_writes.make_selection(200, 10)
+
+    loop_refreshes, _ = bench_writes.run(
+            bench_writes.per_clip_loop, selection, charged=False)
+    grouped_refreshes, _ = bench_writes.run(
+            gtfn.move_positioners, selection, charged=False)
+
+    assert loop_refreshes == 200
+    assert grouped_refreshes == 10